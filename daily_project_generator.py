@@ -10,6 +10,12 @@ import requests
 import schedule
 import time
 import argparse
+import signal
+import subprocess
+import sys
+import cProfile
+import tracemalloc
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from git import Repo
 from dotenv import load_dotenv
@@ -19,17 +25,19 @@ import logging
 load_dotenv()
 
 # Setup logging
+LOG_FILE = 'daily_projects.log'
+
 logging.basicConfig(
     level=logging.INFO,
     format='%(asctime)s - %(levelname)s - %(message)s',
     handlers=[
-        logging.FileHandler('daily_projects.log'),
+        logging.FileHandler(LOG_FILE),
         logging.StreamHandler()
     ]
 )
 
 class DailyProjectGenerator:
-    def __init__(self):
+    def __init__(self, profile=False, trace_memory=False, profile_every=1):
         self.api_key = os.getenv('DEEPSEEK_API_KEY')
         
         # Detect API provider based on key format
@@ -52,6 +60,15 @@ class DailyProjectGenerator:
         self.projects_dir = os.path.join(os.getcwd(), 'projects')
         self.repo_path = os.getcwd()
         
+        # Profiling settings (cProfile / tracemalloc), written next to the log file
+        self.profile = profile
+        self.trace_memory = trace_memory
+        self.profile_every = max(1, profile_every)
+        self.profiles_dir = os.path.join(os.path.dirname(os.path.abspath(LOG_FILE)), 'profiles')
+        self.run_count = 0
+        self.memory_checkpoints = None
+        self.active_run_id = None
+        
         if not self.api_key:
             raise ValueError("API key not set in environment variable")
         
@@ -63,6 +80,12 @@ class DailyProjectGenerator:
         
         # Initialize git repo if not already initialized
         self.init_git_repo()
+        
+        # Push targets, each with its own single-worker executor so pushes to
+        # different remotes run concurrently and a slow mirror only queues behind itself
+        self.push_targets = self.load_push_targets()
+        self.push_executors = {}
+        self.pending_pushes = []
     
     def validate_api_key(self):
         """Validate the API key format and provide helpful feedback"""
@@ -132,6 +155,7 @@ venv.bak/
 
 # Logs
 *.log
+profiles/
 
 # OS
 .DS_Store
@@ -570,24 +594,215 @@ This is a fallback project created by the Daily Mini Project Generator when the
             self.repo.index.commit(commit_message)
             logging.info(f"Committed: {commit_message}")
             
-            # Push to GitHub
-            try:
-                # Check if origin remote exists
-                if 'origin' in [remote.name for remote in self.repo.remotes]:
-                    origin = self.repo.remote(name='origin')
-                    # Push to the current branch (master in this case)
-                    origin.push()
-                    logging.info("Successfully pushed to GitHub repository")
-                else:
-                    logging.warning("No 'origin' remote configured. Please add remote manually.")
-                    logging.info("To add remote: git remote add origin https://github.com/defrein/auto-daily-mini-project.git")
-            except Exception as e:
-                logging.error(f"Failed to push to GitHub: {e}")
-                logging.info("Project committed locally but not pushed to remote")
+            # Push to all configured targets in the background
+            self.push_to_targets()
             
         except Exception as e:
             logging.error(f"Error committing: {e}")
     
+    def get_env_int(self, name, default):
+        """Read an integer setting from the environment, naming the variable if it is invalid"""
+        value = os.getenv(name, str(default))
+        try:
+            return int(value)
+        except ValueError:
+            raise ValueError(f"{name} must be an integer, got {value!r}")
+
+    def load_push_targets(self):
+        """Load push targets from PUSH_TARGETS (comma-separated 'remote' or 'name=url' entries), defaulting to origin"""
+        default_timeout = self.get_env_int('PUSH_TIMEOUT', 120)
+        default_retries = self.get_env_int('PUSH_RETRIES', 2)
+        remote_names = [remote.name for remote in self.repo.remotes]
+
+        entries = []
+        for entry in os.getenv('PUSH_TARGETS', '').split(','):
+            entry = entry.strip()
+            if not entry:
+                continue
+
+            if '=' in entry:
+                name, url = [part.strip() for part in entry.split('=', 1)]
+            else:
+                name, url = entry, None
+            entries.append((name, url))
+
+        if not entries and 'origin' in remote_names:
+            entries = [('origin', None)]
+
+        targets = []
+        for name, url in entries:
+            if url is None and name not in remote_names:
+                logging.error(f"Push target '{name}' is not a configured remote; use name=url or "
+                              f"'git remote add {name} <url>'. Skipping it.")
+                continue
+
+            # Per-target overrides, e.g. PUSH_TIMEOUT_MIRROR=300
+            env_suffix = "".join(c if c.isalnum() else '_' for c in name).upper()
+            targets.append({
+                'name': name,
+                'url': url,
+                'timeout': self.get_env_int(f'PUSH_TIMEOUT_{env_suffix}', default_timeout),
+                'retries': self.get_env_int(f'PUSH_RETRIES_{env_suffix}', default_retries)
+            })
+
+        if targets:
+            logging.info(f"Push targets: {', '.join(target['name'] for target in targets)}")
+        return targets
+
+    def push_to_targets(self):
+        """Push the current commit to every push target concurrently without blocking"""
+        if not self.push_targets:
+            logging.warning("No valid push targets configured (set PUSH_TARGETS or add an 'origin' remote).")
+            logging.info("To add remote: git remote add origin https://github.com/defrein/auto-daily-mini-project.git")
+            logging.info("Project committed locally but not pushed to remote")
+            return
+
+        # Push the exact commit so queued pushes are not affected by later commits
+        commit = self.repo.head.commit.hexsha
+        refspec = f"{commit}:refs/heads/{self.repo.active_branch.name}"
+
+        # Finished pushes have already logged their result; only unexpected errors still need reporting
+        still_pending = []
+        for name, short_commit, future in self.pending_pushes:
+            if not future.done():
+                still_pending.append((name, short_commit, future))
+            elif future.exception() is not None:
+                logging.error(f"Push of {short_commit} to {name} failed unexpectedly: {future.exception()}")
+        self.pending_pushes = still_pending
+
+        for target in self.push_targets:
+            executor = self.push_executors.get(target['name'])
+            if executor is None:
+                executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix=f"push-{target['name']}")
+                self.push_executors[target['name']] = executor
+
+            # Before Python 3.12 cProfile only sees the calling thread, so profiled runs profile each
+            # push worker separately. From 3.12 the run profiler already records every thread and a
+            # second active profiler is rejected.
+            profile_path = None
+            if self.profile and self.active_run_id and sys.version_info < (3, 12):
+                safe_name = "".join(c if c.isalnum() else '_' for c in target['name'])
+                profile_path = os.path.join(self.profiles_dir, f"{self.active_run_id}-push-{safe_name}.prof")
+
+            future = executor.submit(self.push_target, target, commit, refspec, profile_path)
+            self.pending_pushes.append((target['name'], commit[:7], future))
+
+    def push_target(self, target, commit, refspec, profile_path=None):
+        """Push a commit to a single target with its own timeout and retries, returning its status"""
+        name = target['name']
+        destination = target['url'] or name
+        attempts = target['retries'] + 1
+        status = {'target': name, 'commit': commit[:7], 'state': 'failed', 'attempts': 0, 'error': None}
+
+        profiler = cProfile.Profile() if profile_path else None
+        if profiler:
+            try:
+                profiler.enable()
+            except Exception as e:
+                # Profiling is best effort; never let it stop the push
+                logging.warning(f"Could not profile push to {name}: {e}")
+                profiler = None
+
+        start_time = time.perf_counter()
+        try:
+            for attempt in range(1, attempts + 1):
+                status['attempts'] = attempt
+                try:
+                    self.run_git_push(destination, refspec, target['timeout'])
+                    status.update({'state': 'pushed', 'error': None})
+                    logging.info(f"Successfully pushed {status['commit']} to {name} in "
+                                 f"{time.perf_counter() - start_time:.1f}s (attempt {attempt}/{attempts})")
+                    break
+                except Exception as e:
+                    status['error'] = str(e)
+                    logging.warning(f"Push of {status['commit']} to {name} failed (attempt {attempt}/{attempts}): {e}")
+                    if attempt < attempts:
+                        time.sleep(min(2 ** attempt, 30))
+            else:
+                logging.error(f"Failed to push {status['commit']} to {name} after {attempts} attempts")
+        finally:
+            status['duration'] = time.perf_counter() - start_time
+            if profiler:
+                profiler.disable()
+                try:
+                    profiler.dump_stats(profile_path)
+                    logging.info(f"Push profile written: {profile_path}")
+                except Exception as e:
+                    logging.error(f"Failed to write push profile: {e}")
+
+        return status
+
+    def run_git_push(self, destination, refspec, timeout):
+        """Run git push in its own process group and kill the whole group if it exceeds the timeout"""
+        # Never wait for credentials on a background push
+        env = dict(os.environ, GIT_TERMINAL_PROMPT='0')
+        if os.name == 'nt':
+            group_kwargs = {'creationflags': subprocess.CREATE_NEW_PROCESS_GROUP}
+        else:
+            group_kwargs = {'start_new_session': True}
+
+        process = subprocess.Popen(
+            ['git', 'push', destination, refspec],
+            cwd=self.repo_path,
+            env=env,
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            text=True,
+            **group_kwargs
+        )
+        try:
+            _, stderr = process.communicate(timeout=timeout)
+        except subprocess.TimeoutExpired:
+            self.kill_process_tree(process)
+            raise TimeoutError(f"git push to {destination} did not complete in {timeout}s")
+
+        if process.returncode != 0:
+            raise RuntimeError(f"git push to {destination} exited with {process.returncode}: {stderr.strip()}")
+
+    def kill_process_tree(self, process):
+        """Kill a process and every child it spawned (ssh, git-remote-https, hooks)"""
+        try:
+            if os.name == 'nt':
+                subprocess.run(['taskkill', '/F', '/T', '/PID', str(process.pid)],
+                               stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+            else:
+                os.killpg(process.pid, signal.SIGKILL)
+        except Exception as e:
+            logging.warning(f"Failed to kill process tree {process.pid}: {e}")
+            process.kill()
+
+        try:
+            # Reap the process; don't block if something outside the group still holds the pipes
+            process.communicate(timeout=5)
+        except subprocess.TimeoutExpired:
+            pass
+
+    def wait_for_pushes(self):
+        """Wait for in-flight pushes to finish, log a status summary and report whether none failed"""
+        if not self.pending_pushes:
+            logging.info("No pushes were scheduled")
+            return True
+
+        results = []
+        for name, short_commit, future in self.pending_pushes:
+            try:
+                results.append(future.result())
+            except Exception as e:
+                results.append({'target': name, 'commit': short_commit, 'state': 'failed',
+                                'attempts': 0, 'error': str(e), 'duration': 0.0})
+        self.pending_pushes = []
+
+        for status in results:
+            if status['state'] == 'pushed':
+                logging.info(f"Push status - {status['target']} ({status['commit']}): pushed "
+                             f"({status['attempts']} attempt(s), {status['duration']:.1f}s)")
+            else:
+                logging.error(f"Push status - {status['target']} ({status['commit']}): failed "
+                              f"after {status['attempts']} attempt(s) ({status['error']})")
+
+        return all(status['state'] == 'pushed' for status in results)
+
     def generate_daily_project(self):
         """Main function to generate daily project"""
         logging.info("Starting daily project generation...")
@@ -613,16 +828,20 @@ This is a fallback project created by the Daily Mini Project Generator when the
             # Generate project idea
             project_idea = self.generate_project_idea()
             logging.info(f"Generated idea: {project_idea}")
+            self.memory_checkpoint('generate_project_idea')
             
             # Generate project code
             project_code = self.generate_project_code(project_idea)
+            self.memory_checkpoint('generate_project_code')
             
             # Parse and save project
             project_dir = self.parse_and_save_project(project_code)
+            self.memory_checkpoint('parse_and_save_project')
             
             if project_dir:
                 # Commit and push
                 self.commit_and_push(project_dir)
+                self.memory_checkpoint('commit_and_push')
                 logging.info(f"Daily project generated successfully: {project_dir}")
                 return True
             else:
@@ -633,10 +852,93 @@ This is a fallback project created by the Daily Mini Project Generator when the
             logging.error(f"Error in daily project generation: {e}")
             return False
     
+    def should_profile_run(self):
+        """Check whether the current run is sampled for profiling (first run, then every Nth)"""
+        if not (self.profile or self.trace_memory):
+            return False
+        return (self.run_count - 1) % self.profile_every == 0
+
+    def run_with_profiling(self):
+        """Run daily project generation, wrapped in cProfile/tracemalloc when enabled"""
+        self.run_count += 1
+
+        if not self.should_profile_run():
+            return self.generate_daily_project()
+
+        run_id = f"{datetime.now().strftime('%Y-%m-%d-%H-%M-%S')}-run{self.run_count}"
+        os.makedirs(self.profiles_dir, exist_ok=True)
+
+        profiler = cProfile.Profile() if self.profile else None
+        self.active_run_id = run_id
+        if self.trace_memory:
+            self.memory_checkpoints = []
+            tracemalloc.start()
+        if profiler:
+            profiler.enable()
+
+        start_time = time.perf_counter()
+        try:
+            return self.generate_daily_project()
+        finally:
+            elapsed = time.perf_counter() - start_time
+            self.active_run_id = None
+
+            if profiler:
+                profiler.disable()
+                try:
+                    prof_path = os.path.join(self.profiles_dir, f"{run_id}.prof")
+                    profiler.dump_stats(prof_path)
+                    logging.info(f"Profile written: {prof_path} ({elapsed:.2f}s)")
+                except Exception as e:
+                    logging.error(f"Failed to write profile: {e}")
+
+            if self.trace_memory:
+                try:
+                    self.memory_checkpoint('end of run (retained allocations)')
+                    self.save_memory_report(run_id)
+                except Exception as e:
+                    logging.error(f"Failed to write memory report: {e}")
+                finally:
+                    self.memory_checkpoints = None
+                    tracemalloc.stop()
+
+    def memory_checkpoint(self, label, limit=15):
+        """Record live allocations and the peak since the previous checkpoint during a traced run"""
+        if self.memory_checkpoints is None or not tracemalloc.is_tracing():
+            return
+
+        current, peak = tracemalloc.get_traced_memory()
+        snapshot = tracemalloc.take_snapshot().filter_traces((
+            tracemalloc.Filter(False, tracemalloc.__file__),
+            tracemalloc.Filter(False, "<frozen importlib._bootstrap*>"),
+        ))
+        top_stats = [str(stat) for stat in snapshot.statistics('lineno')[:limit]]
+        self.memory_checkpoints.append((label, current, peak, top_stats))
+
+        # Drop the snapshot before resetting so it isn't counted in the next phase's peak
+        del snapshot
+        tracemalloc.reset_peak()
+
+    def save_memory_report(self, run_id):
+        """Write per-phase peaks and live allocations of a traced run to a text file"""
+        overall_peak = max(peak for _, _, peak, _ in self.memory_checkpoints)
+
+        memory_path = os.path.join(self.profiles_dir, f"{run_id}-memory.txt")
+        with open(memory_path, 'w', encoding='utf-8') as f:
+            f.write(f"Peak: {overall_peak / 1024:.1f} KiB\n")
+            f.write("Each phase lists the peak reached while it ran and the allocations still live when it finished.\n")
+            f.write("Temporary allocations (e.g. extract_code_block scans) only show up in the phase peak.\n")
+            for label, current, peak, top_stats in self.memory_checkpoints:
+                f.write(f"\n== After {label}: current {current / 1024:.1f} KiB, peak during phase {peak / 1024:.1f} KiB ==\n")
+                for stat in top_stats:
+                    f.write(f"{stat}\n")
+
+        logging.info(f"Memory report written: {memory_path} (peak {overall_peak / 1024:.1f} KiB)")
+
     def start_scheduler(self):
         """Start the daily scheduler"""
         # Schedule daily project generation at 9:00 AM
-        schedule.every().day.at("09:00").do(self.generate_daily_project)
+        schedule.every().day.at("09:00").do(self.run_with_profiling)
         
         logging.info("Scheduler started. Daily projects will be generated at 9:00 AM")
         logging.info("Press Ctrl+C to stop the scheduler")
@@ -650,27 +952,44 @@ if __name__ == "__main__":
     parser = argparse.ArgumentParser(description='Daily Mini Project Generator')
     parser.add_argument('--now', action='store_true', 
                        help='Generate and push a project immediately without starting the scheduler')
+    parser.add_argument('--profile', action='store_true',
+                       help='Profile each run with cProfile and write a .prof file to profiles/ next to the log')
+    parser.add_argument('--trace-memory', action='store_true',
+                       help='Trace allocations with tracemalloc and write the top allocations to profiles/')
+    parser.add_argument('--profile-every', type=int, default=1, metavar='N',
+                       help='Only profile the first run and every Nth run after it (default: 1, every run)')
     args = parser.parse_args()
     
     try:
-        generator = DailyProjectGenerator()
+        generator = DailyProjectGenerator(
+            profile=args.profile,
+            trace_memory=args.trace_memory,
+            profile_every=args.profile_every
+        )
         
         if args.now:
             # Generate project immediately and exit
             print("🚀 Generating project immediately...")
-            success = generator.generate_daily_project()
-            
-            if success:
+            success = generator.run_with_profiling()
+
+            # Wait for background pushes before exiting
+            pushed = generator.wait_for_pushes()
+
+            if success and not generator.push_targets:
+                print("✅ Project generated and committed locally (no push targets configured)")
+            elif success and pushed:
                 print("✅ Project generated and pushed successfully!")
+            elif success:
+                print("⚠️ Project generated, but not pushed to every target (see daily_projects.log)")
             else:
                 print("❌ Failed to generate project")
-            
+
             # Exit without starting scheduler
-            exit(0 if success else 1)
+            exit(0 if success and pushed else 1)
         
         # Default behavior: generate initial project and ask about scheduler
         print("Generating initial project...")
-        success = generator.generate_daily_project()
+        success = generator.run_with_profiling()
         
         if success:
             print("✅ Initial project generated successfully!")